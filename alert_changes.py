@@ -0,0 +1,124 @@
+import streamlit as st
+import pandas as pd
+
+# ترتيب الشهور لعمل الفترات بالترتيب الزمني الصحيح
+MONTH_ORDER = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+}
+
+MONTH_NAMES = {number: name for name, number in MONTH_ORDER.items()}
+
+# عدد الفترات في السنة لكل نوع (ربع سنوي / شهري)
+PERIODS_PER_YEAR = {"quarter": 4, "month": 12}
+
+NO_DATA_LABEL = "No Data in Current Period"
+
+
+# تحويل الربع ("Q.1" / "Q1" / "q 1") أو الشهر ("JAN" / "January" / 1) لرقم قابل للترتيب
+def _sub_period_rank(text, period_kind):
+    digits = pd.to_numeric(text.str.extract(r"(\d+)", expand=False), errors="coerce")
+    if period_kind == "month":
+        digits = text.str[:3].map(MONTH_ORDER).fillna(digits)
+    return digits.where(digits.between(1, PERIODS_PER_YEAR[period_kind]))
+
+
+# اسم موحد للفترة من السنة والرقم: "2025 Q.1" أو "2025 JAN"
+def _period_label(year, rank, period_kind):
+    if period_kind == "month":
+        return f"{int(year)} {MONTH_NAMES[int(rank)]}"
+    return f"{int(year)} Q.{int(rank)}"
+
+
+# snapshot لحالة الـ Alert لكل (key, A/C TYPE) في كل فترة - مرتبة من الأقدم للأحدث
+@st.cache_data
+def build_alert_snapshots(df, key_col, year_col, sub_period_col, rate_col, alert_col, period_kind):
+    data = df[[key_col, "A/C TYPE", year_col, sub_period_col, rate_col, alert_col]].dropna(
+        subset=[key_col, "A/C TYPE"]
+    ).copy()
+    data[key_col] = data[key_col].astype(str).str.strip()
+    data["A/C TYPE"] = data["A/C TYPE"].astype(str).str.strip()
+    data["RATE"] = pd.to_numeric(data[rate_col], errors="coerce")
+    data["ALERT"] = pd.to_numeric(data[alert_col], errors="coerce")
+
+    # توحيد السنة والربع/الشهر قبل بناء اسم الفترة (q.2 = Q2 = Q.2 و 2025.0 = 2025)
+    sub_text = data[sub_period_col].astype(str).str.strip().str.upper()
+    data["_YEAR"] = pd.to_numeric(data[year_col], errors="coerce")
+    data["_SUB"] = _sub_period_rank(sub_text, period_kind)
+    data = data[data["_YEAR"].notna() & data["_SUB"].notna()]
+    data["PERIOD"] = [
+        _period_label(year, rank, period_kind) for year, rank in zip(data["_YEAR"], data["_SUB"])
+    ]
+
+    # الصف اللي بيحدد الحالة هو اللي فيه أكبر فرق RATE - ALERT
+    data["_MARGIN"] = (data["RATE"] - data["ALERT"]).fillna(float("-inf"))
+    data["EXCEEDING"] = data["_MARGIN"] > 0
+
+    # أكواد فئوية بدل النصوص المتكررة لتقليل حجم كل snapshot
+    data[key_col] = data[key_col].astype("category")
+    data["A/C TYPE"] = data["A/C TYPE"].astype("category")
+
+    periods = (
+        data[["PERIOD", "_YEAR", "_SUB"]]
+        .drop_duplicates("PERIOD")
+        .sort_values(["_YEAR", "_SUB", "PERIOD"])["PERIOD"]
+        .tolist()
+    )
+
+    snapshots = {}
+    for period, group in data.groupby("PERIOD", sort=False):
+        snapshots[period] = (
+            group.sort_values("_MARGIN")
+            .drop_duplicates([key_col, "A/C TYPE"], keep="last")
+            .set_index([key_col, "A/C TYPE"])[["RATE", "ALERT", "EXCEEDING"]]
+        )
+    return {period: snapshots[period] for period in periods}
+
+
+# مقارنة فترتين: Cleared بس لو الـ key موجود في الفترة الحالية وتحت الـ Alert،
+# إلا لو missing_means_cleared (زي الـ CAN) فغياب الصف يعتبر رجوع تحت الـ Alert
+def diff_alert_snapshots(previous, current, missing_means_cleared):
+    merged = previous.join(current, how="outer", lsuffix=" (Prev)", rsuffix=" (Curr)")
+    was = merged["EXCEEDING (Prev)"].eq(True)
+    now = merged["EXCEEDING (Curr)"].eq(True)
+    in_current = merged["EXCEEDING (Curr)"].notna()
+
+    columns = ["RATE (Prev)", "ALERT (Prev)", "RATE (Curr)", "ALERT (Curr)"]
+    merged = merged[columns]
+    changes = {
+        "New": merged[now & ~was].reset_index(),
+        "Persisting": merged[now & was].reset_index(),
+    }
+    if missing_means_cleared:
+        changes["Cleared"] = merged[was & ~now].reset_index()
+    else:
+        changes["Cleared"] = merged[was & in_current & ~now].reset_index()
+        changes[NO_DATA_LABEL] = merged[was & ~in_current].reset_index()
+    return changes
+
+
+def show_alert_changes(snapshots, selected_types, key_label, missing_means_cleared):
+    periods = list(snapshots)
+    if len(periods) < 2:
+        st.info("At least two periods are needed to compare alert status.")
+        return
+
+    # الفترة الحالية لازم تكون بعد الفترة السابقة
+    col_prev, col_curr = st.columns(2)
+    with col_prev:
+        prev_options = periods[:-1]
+        prev_period = st.selectbox("Previous Period", prev_options, index=len(prev_options) - 1)
+    with col_curr:
+        curr_options = periods[periods.index(prev_period) + 1:]
+        curr_period = st.selectbox("Current Period", curr_options, index=len(curr_options) - 1)
+
+    changes = diff_alert_snapshots(snapshots[prev_period], snapshots[curr_period], missing_means_cleared)
+    selected_types = [str(t).strip() for t in selected_types]
+    for label, table in changes.items():
+        table = table[table["A/C TYPE"].isin(selected_types)]
+        changes[label] = table.rename(columns={table.columns[0]: key_label})
+
+    tabs = st.tabs([f"{label} ({len(table)})" for label, table in changes.items()])
+    for tab, label in zip(tabs, changes):
+        with tab:
+            st.dataframe(changes[label], use_container_width=True)
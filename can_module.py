@@ -6,6 +6,7 @@ from io import BytesIO
 from docx import Document
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
+from alert_changes import build_alert_snapshots, show_alert_changes
 
 def show_can_dashboard():
     st.title("🛠️ CAN - Component Alert Notice Dashboard")
@@ -96,6 +97,15 @@ def show_can_dashboard():
     else:
         st.warning("Columns 'REMOVAL RATE' or 'REMOVAL ALERT' not found.")
 
+    # 🔄 مقارنة حالة الـ Alert بين فترتين (ربع سنوي) على كامل البيانات
+    st.markdown("### 🔄 REMOVAL ALERT Status Changes (Quarter over Quarter)")
+    if "REMOVAL RATE" in df.columns and "REMOVAL ALERT" in df.columns:
+        # الـ CAN بيتعمل بس لما الـ P/N يتجاوز، فغياب الصف معناه إنه رجع تحت الـ Alert
+        can_snapshots = build_alert_snapshots(df, "P/N", "YEAR", "QUARTER NO", "REMOVAL RATE", "REMOVAL ALERT", "quarter")
+        show_alert_changes(can_snapshots, selected_types, "Part Number", missing_means_cleared=True)
+    else:
+        st.warning("Columns 'REMOVAL RATE' or 'REMOVAL ALERT' not found.")
+
     st.markdown("---")
     st.subheader("📊 Visual Analytics")
 
@@ -5,7 +5,7 @@ a = Analysis(
     ['run_dashboard.bat'],
     pathex=[],
     binaries=[],
-    datas=[('main.py', '.'), ('can_module.py', '.'), ('san_module.py', '.'), ('SAN.xlsx', '.'), ('CAN.xlsx', '.'), ('egyptair_logo.png', '.')],
+    datas=[('main.py', '.'), ('can_module.py', '.'), ('san_module.py', '.'), ('alert_changes.py', '.'), ('SAN.xlsx', '.'), ('CAN.xlsx', '.'), ('egyptair_logo.png', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
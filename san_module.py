@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from alert_changes import build_alert_snapshots, show_alert_changes
 
 def show_san_dashboard():
     st.title("📘 SAN - System Alert Notice Dashboard")
@@ -24,17 +25,17 @@ def show_san_dashboard():
         top_n_option = st.selectbox("Show Top:", ["All", "Top 3", "Top 6", "Top 10"], index=0)
 
     # Apply filters
+    if selected_etops == "Only ETOPS":
+        df = df[df["ETOPS"] == True]
+    elif selected_etops == "Exclude ETOPS":
+        df = df[df["ETOPS"] != True]
+
     filtered_df = df[
         df["YEARS"].isin(selected_years) &
         df["MONTH"].isin(selected_months) &
         df["A/C TYPE"].isin(selected_types)
     ]
 
-    if selected_etops == "Only ETOPS":
-        filtered_df = filtered_df[filtered_df["ETOPS"] == True]
-    elif selected_etops == "Exclude ETOPS":
-        filtered_df = filtered_df[filtered_df["ETOPS"] != True]
-
     # =============================
     # Table: Filtered SAN Data
     # =============================
@@ -113,6 +114,19 @@ def show_san_dashboard():
     )
     st.plotly_chart(fig2, use_container_width=True)
 
+    # =============================
+    # Lists: Alert status changes between two months
+    # =============================
+    st.markdown("---")
+    st.subheader("🔄 ALERT Status Changes per ATA (Month over Month)")
+
+    if "RATE" in df.columns and "ALERT" in df.columns:
+        # الـ SAN بيسجل الشهور اللي تحت الـ Alert كمان، فغياب الصف معناه مفيش بيانات
+        san_snapshots = build_alert_snapshots(df, "ATA", "YEARS", "MONTH", "RATE", "ALERT", "month")
+        show_alert_changes(san_snapshots, selected_types, "ATA", missing_means_cleared=False)
+    else:
+        st.warning("Columns 'RATE' or 'ALERT' not found.")
+
     # =============================
     # Table: % Exceeding per ATA
     # =============================